@@ -5,10 +5,22 @@
 from .core import OCIFileSystem
 from fsspec import register_implementation
 import sys
-from .utils import __version__
 
 
 if sys.version_info.major < 3:
     raise ImportError("Python < 3 is unsupported.")
 
 register_implementation("oci", OCIFileSystem)
+
+
+def __getattr__(name):
+    # Resolved on first access, see ocifs.utils.
+    if name == "__version__":
+        from .utils import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    from .utils import __version__
@@ -35,7 +35,7 @@ from ocifs.data_lake.lake_sharing_object_storage_client import (
 )
 from ocifs.data_lake.rename_object_details import RenameObjectDetails
 
-from .utils import __version__
+from . import utils
 
 
 logger = logging.getLogger("ocifs")
@@ -383,7 +383,7 @@ class OCIFileSystem(AbstractFileSystem):
         self._update_retry_strategy()
         self._refresh_signer()
         self.config.update(
-            {"additional_user_agent": f"Oracle-ocifs/version={__version__}"}
+            {"additional_user_agent": f"Oracle-ocifs/version={utils.__version__}"}
         )
         self._get_region()
         try:
@@ -3,12 +3,17 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 import logging
 import os
+import threading
+import time
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor
+from weakref import WeakKeyDictionary
 
 import requests
-import six
 from oci import circuit_breaker
 from oci.base_client import BaseClient
 from oci.config import get_config_value_or_default, validate_config
+from oci.exceptions import ServiceError
 from oci.object_storage import ObjectStorageClient
 from oci.retry import retry
 from oci.signer import Signer
@@ -19,13 +24,61 @@ from oci.util import (
     is_content_length_calculable_by_req_util,
     back_up_body_calculate_stream_content_length,
 )
-from oci.object_storage.models import object_storage_type_mapping
+from oci.object_storage.models import (
+    CommitMultipartUploadDetails,
+    CommitMultipartUploadPartDetails,
+    object_storage_type_mapping,
+)
 
 from .lake_sharing_client import LakeSharingClient
-from .lakehouse_client import LakehouseClient
+from .lakehouse_client import (
+    DEFAULT_POOL_MAXSIZE,
+    LakehouseClient,
+    mount_connection_pool,
+)
 
 missing = Sentinel("Missing")
 
+# ParResponse carries no expiry, so multipart PARs are reused for at most this long.
+PAR_CACHE_TTL_SECONDS = 300
+
+DEFAULT_STREAM_CHUNK_SIZE = 1 << 20
+
+# The default buffer_limit of back_up_body_calculate_stream_content_length.
+DEFAULT_BUFFER_LIMIT = 100 * 1024 * 1024
+
+# Statuses with which an endpoint turns down a chunked request body.
+_CHUNKED_REJECTED_STATUSES = frozenset({411, 501})
+
+_UPLOAD_PART_EXPECTED_KWARGS = frozenset(
+    {
+        "allow_control_chars",
+        "retry_strategy",
+        "buffer_limit",
+        "content_length",
+        "opc_client_request_id",
+        "if_match",
+        "if_none_match",
+        "expect",
+        "content_md5",
+        "opc_sse_customer_algorithm",
+        "opc_sse_customer_key",
+        "opc_sse_customer_key_sha256",
+        "opc_sse_kms_key_id",
+    }
+)
+_UPLOAD_PART_REQUIRED_ARGUMENTS = (
+    "namespaceName",
+    "bucketName",
+    "objectName",
+    "uploadId",
+    "uploadPartNum",
+)
+_UPLOAD_PART_RESOURCE_TAIL = (
+    "/n/{namespaceName}/b/{bucketName}/u/{objectName}/id/{uploadId}/{uploadPartNum}"
+)
+_UPLOAD_PART_API_REFERENCE_LINK = "https://docs.oracle.com/iaas/api/#/en/objectstorage/20160918/MultipartUpload/UploadPart"
+
 logger = logging.getLogger("lakesharing")
 
 
@@ -57,6 +110,102 @@ def get_lake_service_endpoint(lake_ocid: str):
     return lake_service_api_endpoint
 
 
+def _seekable_content_length(body):
+    """Returns the number of bytes left in a seekable ``body`` without reading it,
+    or None when the stream cannot be measured in place."""
+    try:
+        position = body.tell()
+        body.seek(0, os.SEEK_END)
+        end = body.tell()
+        body.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return max(end - position, 0)
+
+
+def _fast_content_length(body):
+    """Returns the number of bytes left to send from ``body`` when it can be
+    found without reading the body, or None for streams that cannot be measured."""
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, memoryview):
+        return body.nbytes
+    if hasattr(body, "fileno") and hasattr(body, "tell"):
+        try:
+            return max(os.fstat(body.fileno()).st_size - body.tell(), 0)
+        except (OSError, ValueError):
+            pass
+    if hasattr(body, "__len__") and not isinstance(body, str):
+        return len(body)
+    return _seekable_content_length(body)
+
+
+def _check_body(body):
+    """Raises TypeError for a request body that is not a string, a bytes-like
+    object or a readable stream. A memoryview is returned as a flat byte view,
+    since requests sizes the body with len(), which counts items, not bytes."""
+    if not isinstance(body, (bytes, bytearray, memoryview, str)) and not hasattr(
+        body, "read"
+    ):
+        raise TypeError(
+            "The body must be a string, a bytes-like object, or provide a read() "
+            "method."
+        )
+    if isinstance(body, memoryview):
+        return body.cast("B")
+    return body
+
+
+def _iter_stream(body, chunk_size):
+    while True:
+        chunk = body.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+class _ChunkedBody(object):
+    """Reads a body of unknown length in chunks for chunked transfer encoding.
+
+    The chunks sent are kept, up to ``buffer_limit`` bytes, so that the body can
+    still be resent with a Content-Length if the endpoint rejects chunked
+    encoding. Past that limit the fallback fails with a BufferError, as
+    ``back_up_body_calculate_stream_content_length`` would have.
+    """
+
+    def __init__(self, body, chunk_size, buffer_limit=None):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.buffer_limit = buffer_limit or DEFAULT_BUFFER_LIMIT
+        self._sent = []
+        self._sent_bytes = 0
+
+    def __iter__(self):
+        for chunk in _iter_stream(self.body, self.chunk_size):
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            self._sent_bytes += len(chunk)
+            if self._sent is not None:
+                if self._sent_bytes > self.buffer_limit:
+                    self._sent = None
+                else:
+                    self._sent.append(chunk)
+            yield chunk
+
+    def buffered(self):
+        """Returns the whole body as bytes: the chunks already sent followed by
+        the rest of the stream."""
+        if self._sent is not None:
+            for _ in self:
+                pass
+        if self._sent is None:
+            raise BufferError(
+                "The endpoint rejected chunked transfer encoding and the body is "
+                "larger than the buffer_limit of {} bytes".format(self.buffer_limit)
+            )
+        return b"".join(self._sent)
+
+
 def validate_mount_scope_entity(mount_spec_array):
     mount_scope_entity = mount_spec_array[1].upper()
     mount_scope_entity_allowed_values = ["DATABASE", "TABLE", "USER"]
@@ -135,6 +284,14 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
         :param allow_control_chars: (optional)
             allow_control_chars is a boolean to indicate whether or not this client should allow control characters in the response object. By default, the client will not
             allow control characters to be in the response object.
+
+        :param int stream_chunk_size: (optional)
+            The number of bytes read per chunk when a request body of unknown length is streamed with chunked transfer encoding
+            to a lakehouse managed bucket. Defaults to 1 MiB.
+
+        :param int pool_maxsize: (optional)
+            The number of HTTPS connections kept open for reuse by this client. Set it to at least the number of
+            concurrent part uploads, e.g. the ``max_workers`` of a :py:class:`LakeMultipartSession`. Defaults to 16.
         """
         super().__init__(config, **kwargs)
         validate_config(config, signer=kwargs.get("signer"))
@@ -187,14 +344,25 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             object_storage_type_mapping,
             **base_client_init_kwargs,
         )
+        mount_connection_pool(
+            self.base_client, kwargs.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        )
         self.retry_strategy = kwargs.get("retry_strategy")
         self.circuit_breaker_callback = kwargs.get("circuit_breaker_callback")
+        self.stream_chunk_size = kwargs.get(
+            "stream_chunk_size", DEFAULT_STREAM_CHUNK_SIZE
+        )
         self.config = config or dict()
         self.lake_sharing_client = None
         self.bucket_namespace_to_lake_ocid_map = {}
         self.lake_ocid_to_lake_sharing_client_map = {}
         self.managed_prefix_collection_response_cache = {}
         self.lake_ocid_to_lake_client_map = {}
+        self._par_cache = {}
+        self._default_retry_strategy = (None, None)
+        self._resolved_retry_cache = WeakKeyDictionary()
+        self._par_inflight = {}
+        self._par_inflight_lock = threading.Lock()
 
     def get_lake_sharing_client_by_bucket_namespace(
         self, namespace_name, bucket_name, **kwargs
@@ -203,6 +371,12 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
         cache_key: str = namespace_name + "-" + bucket_name
         lake_ocid = self.bucket_namespace_to_lake_ocid_map.get(cache_key)
         lake_sharing_client = self.lake_ocid_to_lake_sharing_client_map.get(lake_ocid)
+        if lake_sharing_client is None and lake_ocid is not None:
+            # Not cached because the lake sharing service was unhealthy when last
+            # checked, so check it again.
+            lake_sharing_client = self.get_lake_sharing_client(
+                lake_ocid, self.lake_ocid_to_lake_client_map[lake_ocid], **kwargs
+            )
         return lake_sharing_client
 
     def get_lake_sharing_client(
@@ -229,6 +403,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 self.lake_ocid_to_lake_sharing_client_map[lake_ocid] = (
                     lake_sharing_client
                 )
+            else:
+                # The endpoint may have moved; look it up again next time.
+                self.lake_ocid_to_lake_sharing_client_map.pop(lake_ocid, None)
+                lake_client.invalidate_lakeshare_endpoint(lake_ocid)
         return lake_sharing_client
 
     def get_bucket_namespace_for_given_mount_name(
@@ -249,9 +427,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 self.config, lake_service_api_endpoint, **kwargs
             )
             self.lake_ocid_to_lake_client_map[lake_ocid] = lake_client
-        self.lake_ocid_to_lake_sharing_client_map[lake_ocid] = (
-            self.get_lake_sharing_client(lake_ocid, lake_client, **kwargs)
-        )
+        self.get_lake_sharing_client(lake_ocid, lake_client, **kwargs)
         mount_scope_entity_type: str = None
         mount_scope_schema_key: str = None
         mount_scope_table_key: str = None
@@ -309,9 +485,213 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
         )
         return oci_lake_managed
 
+    def _generate_par(
+        self,
+        lake_sharing_client,
+        namespace_name,
+        bucket_name,
+        access_type,
+        object_name,
+        **kwargs,
+    ):
+        """Single-flight wrapper around ``LakeSharingClient.generate_par``: while
+        a PAR for the same namespace, bucket, object (or prefix) and access type
+        is being generated, concurrent callers wait on that request's result
+        instead of issuing their own."""
+        key = (
+            namespace_name,
+            bucket_name,
+            access_type,
+            object_name,
+            kwargs.get("prefix"),
+        )
+        with self._par_inflight_lock:
+            future = self._par_inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._par_inflight[key] = future
+        if not is_leader:
+            logger.debug(f"waiting on in-flight {access_type} par for:{key}")
+            return future.result()
+
+        try:
+            par_response = lake_sharing_client.generate_par(
+                namespace_name, bucket_name, access_type, object_name, **kwargs
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(par_response)
+            return par_response
+        finally:
+            with self._par_inflight_lock:
+                self._par_inflight.pop(key, None)
+
+    def _get_retry_strategy(self, operation_retry_strategy):
+        """Resolves the retry strategy for a call once per operation level
+        strategy and (re)registers the circuit breaker callback only when the
+        strategy does not already carry this client's callback. The default is
+        resolved again whenever ``self.retry_strategy`` is reassigned."""
+        if operation_retry_strategy is None:
+            resolved_for, retry_strategy = self._default_retry_strategy
+            if resolved_for is not self.retry_strategy:
+                retry_strategy = None
+        else:
+            try:
+                retry_strategy = self._resolved_retry_cache.get(
+                    operation_retry_strategy
+                )
+            except TypeError:
+                retry_strategy = None
+        if retry_strategy is None:
+            retry_strategy = self.base_client.get_preferred_retry_strategy(
+                operation_retry_strategy=operation_retry_strategy,
+                client_retry_strategy=self.retry_strategy,
+            )
+            if retry_strategy is None:
+                retry_strategy = retry.DEFAULT_RETRY_STRATEGY
+            if operation_retry_strategy is None:
+                self._default_retry_strategy = (self.retry_strategy, retry_strategy)
+            else:
+                try:
+                    self._resolved_retry_cache[operation_retry_strategy] = (
+                        retry_strategy
+                    )
+                except TypeError:
+                    pass
+
+        if (
+            retry_strategy
+            and not isinstance(retry_strategy, retry.NoneRetryStrategy)
+            and getattr(retry_strategy, "circuit_breaker_callback", None)
+            is not self.circuit_breaker_callback
+        ):
+            retry_strategy.add_circuit_breaker_callback(self.circuit_breaker_callback)
+        return retry_strategy
+
+    def _call_api(self, body=None, **call_kwargs):
+        """``base_client.call_api``, except that a :py:class:`_ChunkedBody` the
+        endpoint rejects is sent once more, buffered and with a Content-Length."""
+        if not isinstance(body, _ChunkedBody):
+            return self.base_client.call_api(body=body, **call_kwargs)
+        try:
+            return self.base_client.call_api(body=body, **call_kwargs)
+        except ServiceError as e:
+            if e.status not in _CHUNKED_REJECTED_STATUSES:
+                raise
+            logger.debug(
+                f"{call_kwargs.get('operation_name')} rejected chunked transfer "
+                f"encoding with status {e.status}, resending the body buffered"
+            )
+        header_params = {
+            k: v
+            for (k, v) in call_kwargs.pop("header_params").items()
+            if k.lower() != "transfer-encoding"
+        }
+        body = body.buffered()
+        header_params["Content-Length"] = str(len(body))
+        return self.base_client.call_api(
+            body=body, header_params=header_params, **call_kwargs
+        )
+
+    def _resolve_lake_sharing(self, namespace_name, bucket_name):
+        """Returns ``(is_lakehouse_managed, lake_sharing_client)`` for a bucket."""
+        lake_sharing_client = None
+        managed = self.is_lakehouse_managed_bucket(namespace_name, bucket_name)
+        if managed:
+            lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
+                namespace_name, bucket_name
+            )
+        return managed, lake_sharing_client
+
+    def open_write_session(self, namespace_name, bucket_name, prefix, **kwargs):
+        """Generates a single WRITE par scoped to ``prefix`` of a lakehouse managed
+        bucket. Passing the returned :py:class:`WriteSession` as the
+        ``write_session`` kwarg of put_object and upload_part reuses that par for
+        every object written under the prefix, renewing it as it nears expiry.
+
+        The par is requested with ``prefix`` as its object name, so writes through
+        the session rely on the lake sharing service issuing a par that covers
+        every object under that prefix. Objects outside it raise ValueError."""
+        managed, lake_sharing_client = self._resolve_lake_sharing(
+            namespace_name, bucket_name
+        )
+        if not managed:
+            raise ValueError(
+                f"{bucket_name}@{namespace_name} is not a lakehouse managed bucket"
+            )
+        write_session = WriteSession(namespace_name, bucket_name, prefix)
+        self._renew_write_session(write_session, lake_sharing_client, **kwargs)
+        return write_session
+
+    def _renew_write_session(self, write_session, lake_sharing_client, **kwargs):
+        kwargs["prefix"] = write_session.prefix
+        par_response = self._generate_par(
+            lake_sharing_client,
+            write_session.namespace_name,
+            write_session.bucket_name,
+            "WRITE",
+            None,
+            **kwargs,
+        )
+        write_session.par_hash = par_response.data.par_hash
+        write_session.expiry = time.monotonic() + PAR_CACHE_TTL_SECONDS
+
+    def _get_write_session_par_hash(
+        self, write_session, namespace_name, bucket_name, object_name
+    ):
+        if (
+            write_session.namespace_name != namespace_name
+            or write_session.bucket_name != bucket_name
+            or not object_name.startswith(write_session.prefix)
+        ):
+            raise ValueError(
+                f"{object_name} in {bucket_name}@{namespace_name} is outside the "
+                f"write session for {write_session.prefix} in "
+                f"{write_session.bucket_name}@{write_session.namespace_name}"
+            )
+        if write_session.expires_soon():
+            _, lake_sharing_client = self._resolve_lake_sharing(
+                namespace_name, bucket_name
+            )
+            self._renew_write_session(write_session, lake_sharing_client)
+        return write_session.par_hash
+
+    def _get_or_create_par(
+        self,
+        lake_sharing_client,
+        namespace_name,
+        bucket_name,
+        object_name,
+        upload_id,
+        kwargs,
+    ):
+        """Returns the WRITE par hash for a multipart upload, generating it only
+        once per ``upload_id`` for as long as ``PAR_CACHE_TTL_SECONDS`` allows."""
+        cached = self._par_cache.get(upload_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        par_response = self._generate_par(
+            lake_sharing_client,
+            namespace_name,
+            bucket_name,
+            "WRITE",
+            object_name,
+            **kwargs,
+        )
+        par_hash = par_response.data.par_hash
+        self._par_cache[upload_id] = (
+            par_hash,
+            time.monotonic() + PAR_CACHE_TTL_SECONDS,
+        )
+        return par_hash
+
     def abort_multipart_upload(
         self, namespace_name, bucket_name, object_name, upload_id, **kwargs
     ):
+        self._par_cache.pop(upload_id, None)
         oci_lake_managed_by_bucket = self.is_lakehouse_managed_bucket(
             namespace_name, bucket_name
         )
@@ -319,8 +699,13 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
                 namespace_name, bucket_name
             )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "WRITE", object_name, **kwargs
+            par_response = self._generate_par(
+                lake_sharing_client,
+                namespace_name,
+                bucket_name,
+                "WRITE",
+                object_name,
+                **kwargs,
             )
             par_hash = par_response.data.par_hash
             required_arguments = [
@@ -342,9 +727,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "retry_strategy",
                 "opc_client_request_id",
             ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = [_key for _key in kwargs if _key not in expected_kwargs]
             if extra_kwargs:
                 raise ValueError(
                     "abort_multipart_upload got unknown kwargs: {!r}".format(
@@ -358,14 +741,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "objectName": object_name,
             }
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            path_params = {k: v for (k, v) in path_params.items() if v is not missing}
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
@@ -375,7 +754,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             query_params = {"uploadId": upload_id}
             query_params = {
                 k: v
-                for (k, v) in six.iteritems(query_params)
+                for (k, v) in query_params.items()
                 if v is not missing and v is not None
             }
 
@@ -386,7 +765,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             header_params = {
                 k: v
-                for (k, v) in six.iteritems(header_params)
+                for (k, v) in header_params.items()
                 if v is not missing and v is not None
             }
 
@@ -444,6 +823,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
         commit_multipart_upload_details,
         **kwargs,
     ):
+        self._par_cache.pop(upload_id, None)
         oci_lake_managed_by_bucket = self.is_lakehouse_managed_bucket(
             namespace_name, bucket_name
         )
@@ -451,8 +831,13 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
                 namespace_name, bucket_name
             )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "WRITE", object_name, **kwargs
+            par_response = self._generate_par(
+                lake_sharing_client,
+                namespace_name,
+                bucket_name,
+                "WRITE",
+                object_name,
+                **kwargs,
             )
             par_hash = par_response.data.par_hash
             required_arguments = [
@@ -481,9 +866,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "if_none_match",
                 "opc_client_request_id",
             ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = [_key for _key in kwargs if _key not in expected_kwargs]
             if extra_kwargs:
                 raise ValueError(
                     "commit_multipart_upload got unknown kwargs: {!r}".format(
@@ -498,14 +881,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "uploadId": upload_id,
             }
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            path_params = {k: v for (k, v) in path_params.items() if v is not missing}
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
@@ -515,7 +894,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             query_params = {"uploadId": upload_id}
             query_params = {
                 k: v
-                for (k, v) in six.iteritems(query_params)
+                for (k, v) in query_params.items()
                 if v is not missing and v is not None
             }
 
@@ -528,7 +907,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             header_params = {
                 k: v
-                for (k, v) in six.iteritems(header_params)
+                for (k, v) in header_params.items()
                 if v is not missing and v is not None
             }
 
@@ -603,8 +982,13 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
                 namespace_name, bucket_name
             )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "WRITE", object_name, **kwargs
+            par_response = self._generate_par(
+                lake_sharing_client,
+                namespace_name,
+                bucket_name,
+                "WRITE",
+                object_name,
+                **kwargs,
             )
             par_hash = par_response.data.par_hash
             required_arguments = ["namespaceName", "bucketName"]
@@ -630,9 +1014,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "opc_sse_customer_key_sha256",
                 "opc_sse_kms_key_id",
             ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = [_key for _key in kwargs if _key not in expected_kwargs]
             if extra_kwargs:
                 raise ValueError(
                     "create_multipart_upload got unknown kwargs: {!r}".format(
@@ -646,14 +1028,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "objectName": object_name,
             }
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            path_params = {k: v for (k, v) in path_params.items() if v is not missing}
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
@@ -678,7 +1056,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             header_params = {
                 k: v
-                for (k, v) in six.iteritems(header_params)
+                for (k, v) in header_params.items()
                 if v is not missing and v is not None
             }
 
@@ -828,16 +1206,6 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             namespace_name, bucket_name
         )
         if oci_lake_managed_by_bucket:
-            lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
-                namespace_name, bucket_name
-            )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "READ", object_name, **kwargs
-            )
-            par_hash = par_response.data.par_hash
-            resource_path = (
-                "/p/" + par_hash + "/n/{namespaceName}/b/{bucketName}/o/{objectName}"
-            )
             required_arguments = ["namespaceName", "bucketName", "objectName"]
             method = "GET"
             operation_name = "get_object"
@@ -862,9 +1230,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "http_response_content_encoding",
                 "http_response_expires",
             ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = [_key for _key in kwargs if _key not in expected_kwargs]
             if extra_kwargs:
                 raise ValueError(
                     "get_object got unknown kwargs: {!r}".format(extra_kwargs)
@@ -876,14 +1242,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "objectName": object_name,
             }
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            path_params = {k: v for (k, v) in path_params.items() if v is not missing}
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
@@ -911,7 +1273,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             query_params = {
                 k: v
-                for (k, v) in six.iteritems(query_params)
+                for (k, v) in query_params.items()
                 if v is not missing and v is not None
             }
 
@@ -932,10 +1294,29 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             header_params = {
                 k: v
-                for (k, v) in six.iteritems(header_params)
+                for (k, v) in header_params.items()
                 if v is not missing and v is not None
             }
 
+            # Only the resource path depends on the PAR, so validate kwargs and
+            # build every other request part first: a bad call fails without
+            # a round trip to the lake sharing service.
+            lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
+                namespace_name, bucket_name
+            )
+            par_response = self._generate_par(
+                lake_sharing_client,
+                namespace_name,
+                bucket_name,
+                "READ",
+                object_name,
+                **kwargs,
+            )
+            par_hash = par_response.data.par_hash
+            resource_path = (
+                "/p/" + par_hash + "/n/{namespaceName}/b/{bucketName}/o/{objectName}"
+            )
+
             retry_strategy = self.base_client.get_preferred_retry_strategy(
                 operation_retry_strategy=kwargs.get("retry_strategy"),
                 client_retry_strategy=self.retry_strategy,
@@ -1019,17 +1400,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             namespace_name, bucket_name
         )
         if oci_lake_managed_by_bucket:
-            lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
-                namespace_name, bucket_name
-            )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "READ", object_name, **kwargs
-            )
-            par_hash = par_response.data.par_hash
             required_arguments = ["namespaceName", "bucketName", "objectName"]
-            resource_path = (
-                "/p/" + par_hash + "/n/{namespaceName}/b/{bucketName}/o/{objectName}"
-            )
             method = "HEAD"
             operation_name = "head_object"
             api_reference_link = "https://docs.oracle.com/iaas/api/#/en/objectstorage/20160918/Object/HeadObject"
@@ -1046,9 +1417,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "opc_sse_customer_key",
                 "opc_sse_customer_key_sha256",
             ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = [_key for _key in kwargs if _key not in expected_kwargs]
             if extra_kwargs:
                 raise ValueError(
                     "head_object got unknown kwargs: {!r}".format(extra_kwargs)
@@ -1060,14 +1429,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "objectName": object_name,
             }
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            path_params = {k: v for (k, v) in path_params.items() if v is not missing}
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
@@ -1077,7 +1442,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             query_params = {"versionId": kwargs.get("version_id", missing)}
             query_params = {
                 k: v
-                for (k, v) in six.iteritems(query_params)
+                for (k, v) in query_params.items()
                 if v is not missing and v is not None
             }
 
@@ -1097,10 +1462,26 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             header_params = {
                 k: v
-                for (k, v) in six.iteritems(header_params)
+                for (k, v) in header_params.items()
                 if v is not missing and v is not None
             }
 
+            lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
+                namespace_name, bucket_name
+            )
+            par_response = self._generate_par(
+                lake_sharing_client,
+                namespace_name,
+                bucket_name,
+                "READ",
+                object_name,
+                **kwargs,
+            )
+            par_hash = par_response.data.par_hash
+            resource_path = (
+                "/p/" + par_hash + "/n/{namespaceName}/b/{bucketName}/o/{objectName}"
+            )
+
             retry_strategy = self.base_client.get_preferred_retry_strategy(
                 operation_retry_strategy=kwargs.get("retry_strategy"),
                 client_retry_strategy=self.retry_strategy,
@@ -1174,8 +1555,13 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
                 namespace_name, bucket_name
             )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "READ", None, **kwargs
+            par_response = self._generate_par(
+                lake_sharing_client,
+                namespace_name,
+                bucket_name,
+                "READ",
+                None,
+                **kwargs,
             )
             par_hash = par_response.data.par_hash
             required_arguments = ["namespaceName", "bucketName"]
@@ -1197,9 +1583,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "opc_client_request_id",
                 "start_after",
             ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = [_key for _key in kwargs if _key not in expected_kwargs]
             if extra_kwargs:
                 raise ValueError(
                     "list_objects got unknown kwargs: {!r}".format(extra_kwargs)
@@ -1207,14 +1591,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
 
             path_params = {"namespaceName": namespace_name, "bucketName": bucket_name}
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            path_params = {k: v for (k, v) in path_params.items() if v is not missing}
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
@@ -1232,7 +1612,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             query_params = {
                 k: v
-                for (k, v) in six.iteritems(query_params)
+                for (k, v) in query_params.items()
                 if v is not missing and v is not None
             }
 
@@ -1243,7 +1623,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
             }
             header_params = {
                 k: v
-                for (k, v) in six.iteritems(header_params)
+                for (k, v) in header_params.items()
                 if v is not missing and v is not None
             }
 
@@ -1332,17 +1712,31 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
     def put_object(
         self, namespace_name, bucket_name, object_name, put_object_body, **kwargs
     ):
-        oci_lake_managed_by_bucket = self.is_lakehouse_managed_bucket(
-            namespace_name, bucket_name
-        )
-        if oci_lake_managed_by_bucket:
-            lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
+        write_session = kwargs.pop("write_session", None)
+        if write_session is not None:
+            oci_lake_managed_by_bucket = True
+        else:
+            oci_lake_managed_by_bucket = self.is_lakehouse_managed_bucket(
                 namespace_name, bucket_name
             )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "WRITE", object_name, **kwargs
-            )
-            par_hash = par_response.data.par_hash
+        if oci_lake_managed_by_bucket:
+            if write_session is not None:
+                par_hash = self._get_write_session_par_hash(
+                    write_session, namespace_name, bucket_name, object_name
+                )
+            else:
+                lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
+                    namespace_name, bucket_name
+                )
+                par_response = self._generate_par(
+                    lake_sharing_client,
+                    namespace_name,
+                    bucket_name,
+                    "WRITE",
+                    object_name,
+                    **kwargs,
+                )
+                par_hash = par_response.data.par_hash
             required_arguments = ["namespaceName", "bucketName", "objectName"]
             resource_path = (
                 "/p/" + par_hash + "/n/{namespaceName}/b/{bucketName}/o/{objectName}"
@@ -1372,9 +1766,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "storage_tier",
                 "opc_meta",
             ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = [_key for _key in kwargs if _key not in expected_kwargs]
             if extra_kwargs:
                 raise ValueError(
                     "put_object got unknown kwargs: {!r}".format(extra_kwargs)
@@ -1386,14 +1778,10 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "objectName": object_name,
             }
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            path_params = {k: v for (k, v) in path_params.items() if v is not missing}
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
@@ -1423,29 +1811,27 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "opc-sse-kms-key-id": kwargs.get("opc_sse_kms_key_id", missing),
                 "storage-tier": kwargs.get("storage_tier", missing),
             }
-            for key, value in six.iteritems(kwargs.get("opc_meta", {})):
+            for key, value in kwargs.get("opc_meta", {}).items():
                 header_params["opc-meta-" + key] = value
             header_params = {
                 k: v
-                for (k, v) in six.iteritems(header_params)
+                for (k, v) in header_params.items()
                 if v is not missing and v is not None
             }
             # Set default value for expect header if user has not overridden it
             lowercase_header_params_keys = [k.lower() for k in header_params]
             if "expect" not in lowercase_header_params_keys:
                 header_params["expect"] = "100-continue"
-            try:
-                put_object_body
-            except NameError:
-                put_object_body = kwargs.get("put_object_body", missing)
+
+            retry_strategy = self.base_client.get_preferred_retry_strategy(
+                operation_retry_strategy=kwargs.get("retry_strategy"),
+                client_retry_strategy=self.retry_strategy,
+            )
+            if retry_strategy is None:
+                retry_strategy = retry.DEFAULT_RETRY_STRATEGY
 
             if put_object_body is not missing and put_object_body is not None:
-                if not isinstance(
-                    put_object_body, (six.binary_type, six.string_types)
-                ) and not hasattr(put_object_body, "read"):
-                    raise TypeError(
-                        "The body must be a string, bytes, or provide a read() method."
-                    )
+                put_object_body = _check_body(put_object_body)
 
                 if (
                     hasattr(put_object_body, "fileno")
@@ -1454,22 +1840,30 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 ):
                     if requests.utils.super_len(put_object_body) == 0:
                         header_params["Content-Length"] = "0"
-                elif (
-                    "Content-Length" not in header_params
-                    and not is_content_length_calculable_by_req_util(put_object_body)
+                elif "Content-Length" not in header_params and (
+                    isinstance(put_object_body, (bytearray, memoryview))
+                    or not is_content_length_calculable_by_req_util(put_object_body)
                 ):
-                    calculated_obj = back_up_body_calculate_stream_content_length(
-                        put_object_body, kwargs.get("buffer_limit")
-                    )
-                    header_params["Content-Length"] = calculated_obj["content_length"]
-                    put_object_body = calculated_obj["byte_content"]
-
-            retry_strategy = self.base_client.get_preferred_retry_strategy(
-                operation_retry_strategy=kwargs.get("retry_strategy"),
-                client_retry_strategy=self.retry_strategy,
-            )
-            if retry_strategy is None:
-                retry_strategy = retry.DEFAULT_RETRY_STRATEGY
+                    content_length = _fast_content_length(put_object_body)
+                    if content_length is not None:
+                        header_params["Content-Length"] = str(content_length)
+                    elif isinstance(retry_strategy, retry.NoneRetryStrategy):
+                        # Nothing will replay the body, so stream it in chunks
+                        # rather than reading it all into memory.
+                        header_params["Transfer-Encoding"] = "chunked"
+                        put_object_body = _ChunkedBody(
+                            put_object_body,
+                            self.stream_chunk_size,
+                            kwargs.get("buffer_limit"),
+                        )
+                    else:
+                        calculated_obj = back_up_body_calculate_stream_content_length(
+                            put_object_body, kwargs.get("buffer_limit")
+                        )
+                        header_params["Content-Length"] = calculated_obj[
+                            "content_length"
+                        ]
+                        put_object_body = calculated_obj["byte_content"]
 
             if retry_strategy:
                 if not isinstance(retry_strategy, retry.NoneRetryStrategy):
@@ -1478,7 +1872,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                         self.circuit_breaker_callback
                     )
                 return retry_strategy.make_retrying_call(
-                    self.base_client.call_api,
+                    self._call_api,
                     resource_path=resource_path,
                     method=method,
                     path_params=path_params,
@@ -1491,7 +1885,7 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                     required_arguments=required_arguments,
                 )
             else:
-                return self.base_client.call_api(
+                return self._call_api(
                     resource_path=resource_path,
                     method=method,
                     path_params=path_params,
@@ -1623,58 +2017,32 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
         upload_part_body,
         **kwargs,
     ):
-        oci_lake_managed_by_bucket = self.is_lakehouse_managed_bucket(
-            namespace_name, bucket_name
-        )
-        if oci_lake_managed_by_bucket:
-            lake_sharing_client = self.get_lake_sharing_client_by_bucket_namespace(
-                namespace_name, bucket_name
-            )
-            par_response = lake_sharing_client.generate_par(
-                namespace_name, bucket_name, "WRITE", object_name, **kwargs
-            )
-            par_hash = par_response.data.par_hash
-            required_arguments = [
-                "namespaceName",
-                "bucketName",
-                "objectName",
-                "uploadId",
-                "uploadPartNum",
-            ]
-            resource_path = (
-                "/p/"
-                + par_hash
-                + "/n/{namespaceName}/b/{bucketName}/u/{objectName}/id/{uploadId}/{uploadPartNum}"
-            )
-            method = "PUT"
-            operation_name = "upload_part"
-            api_reference_link = (
-                "https://docs.oracle.com/iaas/api/#/en/objectstorage/20160918/MultipartUpload"
-                "/UploadPart "
+        write_session = kwargs.pop("write_session", None)
+        if write_session is not None:
+            oci_lake_managed_by_bucket = True
+        else:
+            oci_lake_managed_by_bucket, lake_sharing_client = (
+                self._resolve_lake_sharing(namespace_name, bucket_name)
             )
-
+        if oci_lake_managed_by_bucket:
+            if write_session is not None:
+                par_hash = self._get_write_session_par_hash(
+                    write_session, namespace_name, bucket_name, object_name
+                )
+            else:
+                par_hash = self._get_or_create_par(
+                    lake_sharing_client,
+                    namespace_name,
+                    bucket_name,
+                    object_name,
+                    upload_id,
+                    kwargs,
+                )
             # Don't accept unknown kwargs
-            expected_kwargs = [
-                "allow_control_chars",
-                "retry_strategy",
-                "buffer_limit",
-                "content_length",
-                "opc_client_request_id",
-                "if_match",
-                "if_none_match",
-                "expect",
-                "content_md5",
-                "opc_sse_customer_algorithm",
-                "opc_sse_customer_key",
-                "opc_sse_customer_key_sha256",
-                "opc_sse_kms_key_id",
-            ]
-            extra_kwargs = [
-                _key for _key in six.iterkeys(kwargs) if _key not in expected_kwargs
-            ]
+            extra_kwargs = kwargs.keys() - _UPLOAD_PART_EXPECTED_KWARGS
             if extra_kwargs:
                 raise ValueError(
-                    "upload_part got unknown kwargs: {!r}".format(extra_kwargs)
+                    "upload_part got unknown kwargs: {!r}".format(sorted(extra_kwargs))
                 )
 
             path_params = {
@@ -1685,126 +2053,26 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 "uploadPartNum": upload_part_num,
             }
 
-            path_params = {
-                k: v for (k, v) in six.iteritems(path_params) if v is not missing
-            }
+            for k in [k for k, v in path_params.items() if v is missing]:
+                del path_params[k]
 
-            for k, v in six.iteritems(path_params):
-                if v is None or (
-                    isinstance(v, six.string_types) and len(v.strip()) == 0
-                ):
+            for k, v in path_params.items():
+                if v is None or (isinstance(v, str) and len(v.strip()) == 0):
                     raise ValueError(
                         "Parameter {} cannot be None, whitespace or empty string".format(
                             k
                         )
                     )
 
-            query_params = {"uploadId": upload_id, "uploadPartNum": upload_part_num}
-            query_params = {
-                k: v
-                for (k, v) in six.iteritems(query_params)
-                if v is not missing and v is not None
-            }
-
-            header_params = {
-                "accept": "application/json",
-                "opc-multipart": "true",
-                "opc-client-request-id": kwargs.get("opc_client_request_id", missing),
-                "if-match": kwargs.get("if_match", missing),
-                "if-none-match": kwargs.get("if_none_match", missing),
-                "Expect": kwargs.get("expect", missing),
-                "Content-Length": kwargs.get("content_length", missing),
-                "Content-MD5": kwargs.get("content_md5", missing),
-                "opc-sse-customer-algorithm": kwargs.get(
-                    "opc_sse_customer_algorithm", missing
-                ),
-                "opc-sse-customer-key": kwargs.get("opc_sse_customer_key", missing),
-                "opc-sse-customer-key-sha256": kwargs.get(
-                    "opc_sse_customer_key_sha256", missing
-                ),
-                "opc-sse-kms-key-id": kwargs.get("opc_sse_kms_key_id", missing),
-            }
-            header_params = {
-                k: v
-                for (k, v) in six.iteritems(header_params)
-                if v is not missing and v is not None
-            }
-            lowercase_header_params_keys = [k.lower() for k in header_params]
-            if "expect" not in lowercase_header_params_keys:
-                header_params["expect"] = "100-continue"
-
-            try:
-                upload_part_body
-            except NameError:
-                upload_part_body = kwargs.get("upload_part_body", missing)
-
-            if upload_part_body is not missing and upload_part_body is not None:
-                if not isinstance(
-                    upload_part_body, (six.binary_type, six.string_types)
-                ) and not hasattr(upload_part_body, "read"):
-                    raise TypeError(
-                        "The body must be a string, bytes, or provide a read() method."
-                    )
-
-                if (
-                    hasattr(upload_part_body, "fileno")
-                    and hasattr(upload_part_body, "name")
-                    and upload_part_body.name != "<stdin>"
-                ):
-                    if requests.utils.super_len(upload_part_body) == 0:
-                        header_params["Content-Length"] = "0"
-
-                elif (
-                    "Content-Length" not in header_params
-                    and not is_content_length_calculable_by_req_util(upload_part_body)
-                ):
-                    calculated_obj = back_up_body_calculate_stream_content_length(
-                        upload_part_body, kwargs.get("buffer_limit")
-                    )
-                    header_params["Content-Length"] = calculated_obj["content_length"]
-                    upload_part_body = calculated_obj["byte_content"]
-
-            retry_strategy = self.base_client.get_preferred_retry_strategy(
-                operation_retry_strategy=kwargs.get("retry_strategy"),
-                client_retry_strategy=self.retry_strategy,
+            return self._upload_part_prepared(
+                "/p/" + par_hash + _UPLOAD_PART_RESOURCE_TAIL,
+                path_params,
+                upload_id,
+                upload_part_num,
+                upload_part_body,
+                self._get_retry_strategy(kwargs.get("retry_strategy")),
+                **kwargs,
             )
-            if retry_strategy is None:
-                retry_strategy = retry.DEFAULT_RETRY_STRATEGY
-
-            if retry_strategy:
-                if not isinstance(retry_strategy, retry.NoneRetryStrategy):
-                    self.base_client.add_opc_client_retries_header(header_params)
-                    retry_strategy.add_circuit_breaker_callback(
-                        self.circuit_breaker_callback
-                    )
-                return retry_strategy.make_retrying_call(
-                    self.base_client.call_api,
-                    resource_path=resource_path,
-                    method=method,
-                    path_params=path_params,
-                    query_params=query_params,
-                    header_params=header_params,
-                    body=upload_part_body,
-                    enforce_content_headers=False,
-                    allow_control_chars=kwargs.get("allow_control_chars"),
-                    operation_name=operation_name,
-                    api_reference_link=api_reference_link,
-                    required_arguments=required_arguments,
-                )
-            else:
-                return self.base_client.call_api(
-                    resource_path=resource_path,
-                    method=method,
-                    path_params=path_params,
-                    query_params=query_params,
-                    header_params=header_params,
-                    body=upload_part_body,
-                    enforce_content_headers=False,
-                    allow_control_chars=kwargs.get("allow_control_chars"),
-                    operation_name=operation_name,
-                    api_reference_link=api_reference_link,
-                    required_arguments=required_arguments,
-                )
         else:
             return ObjectStorageClient.upload_part(
                 self,
@@ -1816,3 +2084,276 @@ class LakeSharingObjectStorageClient(ObjectStorageClient):
                 upload_part_body,
                 **kwargs,
             )
+
+    def _upload_part_prepared(
+        self,
+        resource_path,
+        path_params,
+        upload_id,
+        upload_part_num,
+        upload_part_body,
+        retry_strategy,
+        **kwargs,
+    ):
+        """Sends one part of a multipart upload to a lakehouse managed bucket once
+        the par, path params and retry strategy have been resolved and validated
+        by the caller."""
+        method = "PUT"
+        operation_name = "upload_part"
+
+        query_params = {"uploadId": upload_id, "uploadPartNum": upload_part_num}
+        for k in [k for k, v in query_params.items() if v is missing or v is None]:
+            del query_params[k]
+
+        header_params = {
+            "accept": "application/json",
+            "opc-multipart": "true",
+            "opc-client-request-id": kwargs.get("opc_client_request_id", missing),
+            "if-match": kwargs.get("if_match", missing),
+            "if-none-match": kwargs.get("if_none_match", missing),
+            "Expect": kwargs.get("expect", missing),
+            "Content-Length": kwargs.get("content_length", missing),
+            "Content-MD5": kwargs.get("content_md5", missing),
+            "opc-sse-customer-algorithm": kwargs.get(
+                "opc_sse_customer_algorithm", missing
+            ),
+            "opc-sse-customer-key": kwargs.get("opc_sse_customer_key", missing),
+            "opc-sse-customer-key-sha256": kwargs.get(
+                "opc_sse_customer_key_sha256", missing
+            ),
+            "opc-sse-kms-key-id": kwargs.get("opc_sse_kms_key_id", missing),
+        }
+        for k in [k for k, v in header_params.items() if v is missing or v is None]:
+            del header_params[k]
+        if not any(k.lower() == "expect" for k in header_params):
+            header_params["expect"] = "100-continue"
+
+        if upload_part_body is not missing and upload_part_body is not None:
+            upload_part_body = _check_body(upload_part_body)
+
+            if (
+                hasattr(upload_part_body, "fileno")
+                and hasattr(upload_part_body, "name")
+                and upload_part_body.name != "<stdin>"
+            ):
+                if requests.utils.super_len(upload_part_body) == 0:
+                    header_params["Content-Length"] = "0"
+
+            elif "Content-Length" not in header_params and (
+                isinstance(upload_part_body, (bytearray, memoryview))
+                or not is_content_length_calculable_by_req_util(upload_part_body)
+            ):
+                content_length = _fast_content_length(upload_part_body)
+                if content_length is not None:
+                    header_params["Content-Length"] = str(content_length)
+                elif isinstance(retry_strategy, retry.NoneRetryStrategy):
+                    header_params["Transfer-Encoding"] = "chunked"
+                    upload_part_body = _ChunkedBody(
+                        upload_part_body,
+                        self.stream_chunk_size,
+                        kwargs.get("buffer_limit"),
+                    )
+                else:
+                    calculated_obj = back_up_body_calculate_stream_content_length(
+                        upload_part_body, kwargs.get("buffer_limit")
+                    )
+                    header_params["Content-Length"] = calculated_obj["content_length"]
+                    upload_part_body = calculated_obj["byte_content"]
+
+        call_kwargs = dict(
+            resource_path=resource_path,
+            method=method,
+            path_params=path_params,
+            query_params=query_params,
+            header_params=header_params,
+            body=upload_part_body,
+            enforce_content_headers=False,
+            allow_control_chars=kwargs.get("allow_control_chars"),
+            operation_name=operation_name,
+            api_reference_link=_UPLOAD_PART_API_REFERENCE_LINK,
+            required_arguments=_UPLOAD_PART_REQUIRED_ARGUMENTS,
+        )
+        if retry_strategy:
+            if not isinstance(retry_strategy, retry.NoneRetryStrategy):
+                self.base_client.add_opc_client_retries_header(header_params)
+            return retry_strategy.make_retrying_call(self._call_api, **call_kwargs)
+        return self._call_api(**call_kwargs)
+
+
+class WriteSession(object):
+    """A WRITE par scoped to an object name prefix of a lakehouse managed bucket,
+    as returned by :py:meth:`LakeSharingObjectStorageClient.open_write_session`."""
+
+    #: The session is renewed once less than this fraction of its lifetime is left.
+    RENEW_FRACTION = 0.25
+
+    def __init__(self, namespace_name, bucket_name, prefix, par_hash=None, expiry=0.0):
+        self.namespace_name = namespace_name
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.par_hash = par_hash
+        self.expiry = expiry
+
+    def expires_soon(self):
+        remaining = self.expiry - time.monotonic()
+        return remaining < PAR_CACHE_TTL_SECONDS * self.RENEW_FRACTION
+
+
+class LakeMultipartSession(object):
+    """Uploads the parts of one multipart upload to a lakehouse managed bucket
+    concurrently.
+
+    The lake sharing client, WRITE par and retry strategy are resolved once for
+    the whole session. Each part is retried on its own by the retry strategy, and
+    at most ``max_workers`` part bodies are in flight at any time.
+
+    Used as a context manager, the upload is aborted if the block is left without
+    a successful :py:meth:`commit`.
+    """
+
+    def __init__(
+        self,
+        client,
+        namespace_name,
+        bucket_name,
+        object_name,
+        upload_id,
+        max_workers=8,
+        **kwargs,
+    ):
+        managed, lake_sharing_client = client._resolve_lake_sharing(
+            namespace_name, bucket_name
+        )
+        if not managed:
+            raise ValueError(
+                f"{bucket_name}@{namespace_name} is not a lakehouse managed bucket"
+            )
+        path_params = {
+            "namespaceName": namespace_name,
+            "bucketName": bucket_name,
+            "objectName": object_name,
+            "uploadId": upload_id,
+        }
+        for k, v in path_params.items():
+            if v is None or (isinstance(v, str) and len(v.strip()) == 0):
+                raise ValueError(
+                    "Parameter {} cannot be None, whitespace or empty string".format(k)
+                )
+        self.client = client
+        self.lake_sharing_client = lake_sharing_client
+        self.namespace_name = namespace_name
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.upload_id = upload_id
+        # The same quoting BaseClient.call_api applies when it fills in path params.
+        self._quoted_path = "/n/{}/b/{}/u/{}/id/{}".format(
+            *(urllib.parse.quote(str(v), safe="") for v in path_params.values())
+        )
+        self._resource_prefix = (None, None)
+        self._get_resource_prefix(kwargs)
+        self.retry_strategy = client._get_retry_strategy(kwargs.get("retry_strategy"))
+        self.parts = {}
+        self._closed = False
+        self._futures = []
+        self._slots = threading.Semaphore(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit_part(self, upload_part_num, upload_part_body, **kwargs):
+        """Queues one part for upload and returns its ``Future``. Blocks while
+        ``max_workers`` parts are already in flight."""
+        extra_kwargs = kwargs.keys() - _UPLOAD_PART_EXPECTED_KWARGS
+        if extra_kwargs:
+            raise ValueError(
+                "submit_part got unknown kwargs: {!r}".format(sorted(extra_kwargs))
+            )
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(
+                self._upload_part, upload_part_num, upload_part_body, kwargs
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+        return future
+
+    def _get_resource_prefix(self, kwargs):
+        # A dict lookup while the cached par is fresh, a new par once it expires.
+        par_hash = self.client._get_or_create_par(
+            self.lake_sharing_client,
+            self.namespace_name,
+            self.bucket_name,
+            self.object_name,
+            self.upload_id,
+            kwargs,
+        )
+        cached_par_hash, resource_prefix = self._resource_prefix
+        if par_hash != cached_par_hash:
+            resource_prefix = "/p/" + par_hash + self._quoted_path
+            self._resource_prefix = (par_hash, resource_prefix)
+        return resource_prefix
+
+    def _upload_part(self, upload_part_num, upload_part_body, kwargs):
+        response = self.client._upload_part_prepared(
+            f"{self._get_resource_prefix(kwargs)}/{upload_part_num}",
+            {},
+            self.upload_id,
+            upload_part_num,
+            upload_part_body,
+            self.retry_strategy,
+            **kwargs,
+        )
+        self.parts[upload_part_num] = response.headers["etag"]
+        return response
+
+    def commit(self, **kwargs):
+        """Waits for every submitted part and commits the upload. The first part
+        failure is raised instead, leaving the upload for the caller to abort."""
+        try:
+            try:
+                for future in self._futures:
+                    future.result()
+            finally:
+                self._executor.shutdown(wait=True)
+            commit_details = CommitMultipartUploadDetails(
+                parts_to_commit=[
+                    CommitMultipartUploadPartDetails(part_num=part_num, etag=etag)
+                    for part_num, etag in sorted(self.parts.items())
+                ]
+            )
+            response = self.client.commit_multipart_upload(
+                self.namespace_name,
+                self.bucket_name,
+                self.object_name,
+                self.upload_id,
+                commit_details,
+                **kwargs,
+            )
+        finally:
+            self.client._par_cache.pop(self.upload_id, None)
+        self._closed = True
+        return response
+
+    def abort(self, **kwargs):
+        try:
+            for future in self._futures:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            return self.client.abort_multipart_upload(
+                self.namespace_name,
+                self.bucket_name,
+                self.object_name,
+                self.upload_id,
+                **kwargs,
+            )
+        finally:
+            self.client._par_cache.pop(self.upload_id, None)
+            self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._closed:
+            self.abort()
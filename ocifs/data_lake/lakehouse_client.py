@@ -5,8 +5,11 @@ from __future__ import absolute_import
 
 import logging
 import os
+import threading
+import time
 
 from oci._vendor import requests  # noqa: F401
+from oci._vendor.requests.adapters import HTTPAdapter
 from oci._vendor import six
 
 from oci import retry, circuit_breaker  # noqa: F401
@@ -26,6 +29,9 @@ from .mount_specification import MountSpecification
 
 missing = Sentinel("Missing")
 
+MOUNT_TYPES = frozenset({"EXTERNAL", "MANAGED"})
+MOUNT_SCOPE_ENTITY_TYPES = frozenset({"DATABASE", "TABLE", "USER"})
+
 # Maps type name to class for lakehouse services.
 lakehouse_type_mapping = {
     "Lakehouse": Lakehouse,
@@ -36,6 +42,20 @@ lakehouse_type_mapping = {
 logger = logging.getLogger("lakehouse")
 
 
+DEFAULT_POOL_MAXSIZE = 16
+
+
+def mount_connection_pool(base_client, pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    """Sizes the HTTPS connection pool of a BaseClient's session, so concurrent
+    requests reuse connections instead of opening and dropping extra ones."""
+    base_client.session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=0
+        ),
+    )
+
+
 def setup_logging_for_lakehouse(level=None):
     level = level or os.environ["OCIFS_LOGGING_LEVEL"]
     handle = logging.StreamHandler()
@@ -92,21 +112,13 @@ class LakehouseClient(object):
 
             This should be one of the strategies available in the :py:mod:`~oci.retry` module. A convenience :py:data:`~oci.retry.DEFAULT_RETRY_STRATEGY`
             is also available. The specifics of the default retry strategy are described `here <https://oracle-cloud-infrastructure-python-sdk.readthedocs.io/en/latest/sdk_behaviors/retries.html>`__.
+
+        :param int pool_maxsize: (optional)
+            The number of HTTPS connections kept open for reuse by this client. Defaults to 16.
         """
         validate_config(config, signer=kwargs.get("signer"))
-        if "signer" in kwargs:
-            signer = kwargs["signer"]
-        elif AUTHENTICATION_TYPE_FIELD_NAME in config:
-            signer = get_signer_from_authentication_type(config)
-        else:
-            signer = Signer(
-                tenancy=config["tenancy"],
-                user=config["user"],
-                fingerprint=config["fingerprint"],
-                private_key_file_location=config.get("key_file"),
-                pass_phrase=get_config_value_or_default(config, "pass_phrase"),
-                private_key_content=config.get("key_content"),
-            )
+        self.config = config
+        self.signer = kwargs.get("signer")
         self.lake_service_api_endpoint = lake_service_api_endpoint
         logger.debug(
             f"lakehouse service api endpoint is: {self.lake_service_api_endpoint}"
@@ -116,7 +128,6 @@ class LakehouseClient(object):
             "service_endpoint": self.lake_service_api_endpoint,
             "base_path": "/20221010",
             "service_endpoint_template": "https://lake.{region}.oci.{secondLevelDomain}",
-            "service_endpoint_template": "https://objectstorage.{region}.{secondLevelDomain}",
             "endpoint_service_name": "lakehouse",
             "skip_deserialization": kwargs.get("skip_deserialization", False),
             "circuit_breaker_strategy": kwargs.get(
@@ -136,15 +147,58 @@ class LakehouseClient(object):
             )
         self.retry_strategy = kwargs.get("retry_strategy")
         self.circuit_breaker_callback = kwargs.get("circuit_breaker_callback")
-        self.base_client = BaseClient(
-            "lakehouse",
-            config,
-            signer,
-            lakehouse_type_mapping,
-            **base_client_init_kwargs,
-        )
+        self.pool_maxsize = kwargs.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        self.base_client_init_kwargs = base_client_init_kwargs
+        self._base_client = None
+        self._base_client_lock = threading.Lock()
+        self._lakeshare_endpoint_cache = {}
+        self._lakeshare_endpoint_ttl = float(os.environ.get("OCIFS_LAKESHARE_TTL", 600))
         logger.debug(f"lakehouse client got initialized !!!!!!!!")
 
+    @property
+    def base_client(self):
+        """
+        The BaseClient of this service client. It and its signer are only built
+        on first use, which keeps constructing a LakehouseClient cheap.
+        """
+        if self._base_client is None:
+            with self._base_client_lock:
+                if self._base_client is None:
+                    if self.signer is not None:
+                        signer = self.signer
+                    elif AUTHENTICATION_TYPE_FIELD_NAME in self.config:
+                        signer = get_signer_from_authentication_type(self.config)
+                    else:
+                        signer = Signer(
+                            tenancy=self.config["tenancy"],
+                            user=self.config["user"],
+                            fingerprint=self.config["fingerprint"],
+                            private_key_file_location=self.config.get("key_file"),
+                            pass_phrase=get_config_value_or_default(
+                                self.config, "pass_phrase"
+                            ),
+                            private_key_content=self.config.get("key_content"),
+                        )
+                    base_client = BaseClient(
+                        "lakehouse",
+                        self.config,
+                        signer,
+                        lakehouse_type_mapping,
+                        **self.base_client_init_kwargs,
+                    )
+                    mount_connection_pool(base_client, self.pool_maxsize)
+                    self._base_client = base_client
+        return self._base_client
+
+    def invalidate_lakeshare_endpoint(self, lake_id):
+        """
+        Drops the cached lakesharing endpoint of the given lake, so that the next
+        get_lakeshare_endpoint call fetches it again.
+        :param str lake_id: (required)
+            unique Lake identifier
+        """
+        self._lakeshare_endpoint_cache.pop(lake_id, None)
+
     def get_lakeshare_endpoint(self, lake_id, **kwargs):
         """
         Gets a lakesharing endpoint  by for the given
@@ -152,7 +206,12 @@ class LakehouseClient(object):
             unique Lake identifier
         :return: A :class:`~oci.response.Response` object with data of type :class:`~oci.lakehouse.models.Lakehouse`
         :rtype: :class:`~oci.response.Response`
+
+        Endpoints are cached per lake for OCIFS_LAKESHARE_TTL seconds (600 by default).
         """
+        cached = self._lakeshare_endpoint_cache.get(lake_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
         lake_resource_path = "/lakes/" + lake_id
         method = "GET"
         header_params = {
@@ -198,6 +257,10 @@ class LakehouseClient(object):
                 f"{lake_id} and exception details:{excep}"
             )
             raise translate_oci_error(excep) from excep
+        self._lakeshare_endpoint_cache[lake_id] = (
+            lakeshare_endpoint,
+            time.monotonic() + self._lakeshare_endpoint_ttl,
+        )
         return lakeshare_endpoint
 
     def get_lakehouse_mount(
@@ -240,20 +303,18 @@ class LakehouseClient(object):
         method = "GET"
         if not mount_type:
             mount_type = "EXTERNAL"
-        mount_type_allowed_values = ["EXTERNAL", "MANAGED"]
-        if mount_type not in mount_type_allowed_values:
+        if mount_type not in MOUNT_TYPES:
             raise ValueError(
                 "Invalid value for `mount_type`, must be one of {0}".format(
-                    mount_type_allowed_values
+                    sorted(MOUNT_TYPES)
                 )
             )
         query_params = {}
         if mount_type == "MANAGED":
-            mount_scope_entity_type_allowed_values = ["DATABASE", "TABLE", "USER"]
-            if mount_scope_entity_type not in mount_scope_entity_type_allowed_values:
+            if mount_scope_entity_type not in MOUNT_SCOPE_ENTITY_TYPES:
                 raise ValueError(
                     "Invalid value for `mount_scope_entity_type`, must be one of {0}".format(
-                        mount_scope_entity_type_allowed_values
+                        sorted(MOUNT_SCOPE_ENTITY_TYPES)
                     )
                 )
             if mount_scope_entity_type == "DATABASE" and not mount_scope_schema_key:
@@ -0,0 +1,57 @@
+# coding: utf-8
+# Copyright (c) 2021, 2024 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+import os
+
+import oci
+import pytest
+
+
+@pytest.fixture(scope="session")
+def storage_options():
+    # With any other OCIFS_IAM_TYPE, e.g. resource_principal, OCIFileSystem picks
+    # up its authentication from the environment on its own.
+    if os.environ.get("OCIFS_IAM_TYPE", "api_key") == "api_key":
+        return {"config": oci.config.from_file("~/.oci/config")}
+    return {}
+
+
+# Payloads up to this size are kept for the session; larger ones, such as the
+# 1 GiB objects of test_large_append, are built per call and freed with the test.
+PAYLOAD_CACHE_LIMIT = 64 * 2**20
+
+
+def _filled(fill, size):
+    """Return a ``size``-byte buffer of the single byte ``fill``, built in one
+    zero-filled allocation by doubling copies rather than ``fill * size``."""
+    buf = bytearray(size)
+    if fill != b"\0" and size:
+        view = memoryview(buf)
+        view[:1] = fill
+        filled = 1
+        while filled < size:
+            n = min(filled, size - filled)
+            view[filled : filled + n] = view[:n]
+            filled += n
+    return buf
+
+
+@pytest.fixture(scope="session")
+def payload():
+    """Return ``size`` bytes of ``fill`` as a view over one shared buffer per fill.
+
+    The buffer is replaced by a larger one only when a test asks for more than
+    has been built so far, so payloads are allocated once per session instead of
+    once per test. Payloads over ``PAYLOAD_CACHE_LIMIT`` are not kept.
+    """
+    buffers = {}
+
+    def make(fill, size):
+        buf = buffers.get(fill)
+        if buf is None or len(buf) < size:
+            buf = _filled(fill, size)
+            if size <= PAYLOAD_CACHE_LIMIT:
+                buffers[fill] = buf
+        return memoryview(buf)[:size]
+
+    return make
@@ -5,24 +5,40 @@ import pandas as pd
 import numpy as np
 import os
 import pytest
-import oci
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from ocifs import OCIFileSystem
 
-config = oci.config.from_file("~/.oci/config")
-storage_options = {"config": config}
-
 namespace_name = os.environ["OCIFS_TEST_NAMESPACE"]
 test_bucket_name = os.environ["OCIFS_TEST_BUCKET"]
 remote_folder = f"oci://{test_bucket_name}-int@{namespace_name}/sample_data"
+# reset_folder empties remote_folder before every test, so pytest-xdist workers
+# each need a folder of their own.
+xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if xdist_worker:
+    remote_folder = f"{remote_folder}/{xdist_worker}"
 
 
-@pytest.fixture(autouse=True)
-def reset_folder():
-    oci_fs = OCIFileSystem(config=config)
+@pytest.fixture(scope="session")
+def oci_fs(storage_options):
+    return OCIFileSystem(**storage_options)
+
+
+def _rm_if_exists(oci_fs, path):
     try:
-        oci_fs.rm(remote_folder, recursive=True)
+        oci_fs.rm(path)
     except FileNotFoundError:
         pass
+
+
+@pytest.fixture(autouse=True)
+def reset_folder(oci_fs):
+    try:
+        paths = oci_fs.find(remote_folder)
+    except FileNotFoundError:
+        paths = []
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(partial(_rm_if_exists, oci_fs), paths))
     yield
 
 
@@ -30,7 +46,7 @@ def reset_folder():
 #     assert pd.__version__ >= "1.2"
 
 
-def test_rw_small():
+def test_rw_small(storage_options):
     sample_data = {"A": [1, 2], "B": [3, 4]}
     small_fn = os.path.join(remote_folder, "small.csv")
 
@@ -40,21 +56,44 @@ def test_rw_small():
     assert df_reloaded.equals(df)
 
 
-def test_rw_large():
-    sample_data = {
-        "A": np.arange(10000),
-        "B": np.arange(10000) * 2,
-        "C": np.arange(10000) * 3,
-    }
-    large_fn = os.path.join(remote_folder, "large.csv")
+def _large_frame():
+    return pd.DataFrame(
+        np.arange(10000)[:, None] * np.array([1, 2, 3]), columns=["A", "B", "C"]
+    )
+
+
+@pytest.mark.parametrize(
+    "compression, suffix", [("gzip", ".gz"), ("zstd", ".zst"), (None, "")]
+)
+def test_rw_large(compression, suffix, storage_options):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    large_fn = os.path.join(remote_folder, "large.csv" + suffix)
+
+    df = _large_frame()
+    df.to_csv(
+        large_fn,
+        index=False,
+        compression=compression,
+        storage_options=storage_options,
+    )
+    df_reloaded = pd.read_csv(
+        large_fn, compression=compression, storage_options=storage_options
+    )
+    assert df_reloaded.equals(df)
 
-    df = pd.DataFrame(sample_data)
-    df.to_csv(large_fn, index=False, storage_options=storage_options)
-    df_reloaded = pd.read_csv(large_fn, storage_options=storage_options)
+
+def test_rw_large_parquet(storage_options):
+    pytest.importorskip("pyarrow")
+    large_fn = os.path.join(remote_folder, "large.parquet")
+
+    df = _large_frame()
+    df.to_parquet(large_fn, index=False, storage_options=storage_options)
+    df_reloaded = pd.read_parquet(large_fn, storage_options=storage_options)
     assert df_reloaded.equals(df)
 
 
-def test_new_bucket():
+def test_new_bucket(storage_options):
     storage_options2 = {
         "create_parents": True,
     }
@@ -12,9 +12,13 @@ full_external_mount_name = os.environ["OCIFS_EXTERNAL_MOUNT_URI"]
 storage_options = {"config": config}
 
 
+@pytest.fixture(scope="session")
+def oci_fs():
+    return OCIFileSystem(config=config, profile="iad_prod")
+
+
 @pytest.fixture(autouse=True)
-def reset_folder():
-    oci_fs = OCIFileSystem(config=config, profile="iad_prod")
+def reset_folder(oci_fs):
     try:
         if oci_fs.lexists(full_external_mount_name + "/a/employees.csv"):
             oci_fs.rm(full_external_mount_name + "/a/employees.csv")
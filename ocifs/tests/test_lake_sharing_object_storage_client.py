@@ -0,0 +1,434 @@
+# coding: utf-8
+# Copyright (c) 2021, 2024 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+"""Unit tests of LakeSharingObjectStorageClient against a mocked BaseClient.
+
+Unlike test_spec_lake these need neither credentials nor a lake mount.
+"""
+
+import array
+import io
+import time
+from unittest import mock
+
+import pytest
+from oci.exceptions import ServiceError
+from oci.retry import retry
+
+from ocifs.data_lake.lake_sharing_object_storage_client import (
+    LakeMultipartSession,
+    LakeSharingObjectStorageClient,
+    _ChunkedBody,
+    _fast_content_length,
+)
+
+NAMESPACE = "ns"
+BUCKET = "bucket"
+LAKE_OCID = "ocid1.lake.oc1.iad.unittest"
+LAKE_MODULE = "ocifs.data_lake.lake_sharing_object_storage_client"
+
+
+class UnsizedStream(object):
+    """A stream with nothing but read(), so its length is unknown until read."""
+
+    def __init__(self, data):
+        self._buffer = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._buffer.read(size)
+
+
+def response(**headers):
+    return mock.Mock(status=200, headers=headers)
+
+
+@pytest.fixture
+def lake_sharing_client():
+    lake_sharing_client = mock.Mock()
+    lake_sharing_client.generate_par.return_value = mock.Mock(
+        data=mock.Mock(par_hash="par-hash")
+    )
+    return lake_sharing_client
+
+
+@pytest.fixture
+def client(lake_sharing_client):
+    # A bare mock signer is not one of the signer types validate_config accepts
+    # in place of user credentials, so skip the check in both constructors.
+    with mock.patch("oci.object_storage.object_storage_client.validate_config"):
+        with mock.patch(f"{LAKE_MODULE}.validate_config"):
+            client = LakeSharingObjectStorageClient(
+                {"region": "us-ashburn-1"}, signer=mock.Mock(), stream_chunk_size=4
+            )
+    client.base_client = mock.Mock()
+    client.base_client.get_preferred_retry_strategy.return_value = (
+        retry.NoneRetryStrategy()
+    )
+    client.base_client.call_api.return_value = response(etag="etag")
+    client.bucket_namespace_to_lake_ocid_map[f"{NAMESPACE}-{BUCKET}"] = LAKE_OCID
+    client.lake_ocid_to_lake_sharing_client_map[LAKE_OCID] = lake_sharing_client
+    return client
+
+
+def rejected(status=411):
+    return ServiceError(status, "LengthRequired", {}, "chunked encoding rejected")
+
+
+def reject_chunked_after_one_chunk(client):
+    """Make call_api read one chunk of a chunked body and then reject it, as an
+    endpoint that requires a Content-Length does. Returns the recorded calls."""
+    calls = []
+
+    def call_api(**call_kwargs):
+        calls.append(dict(call_kwargs))
+        if isinstance(call_kwargs["body"], _ChunkedBody):
+            next(iter(call_kwargs["body"]))
+            raise rejected()
+        return response(etag="etag")
+
+    client.base_client.call_api.side_effect = call_api
+    return calls
+
+
+def test_put_object_streams_unsized_body_chunked(client):
+    client.put_object(NAMESPACE, BUCKET, "obj", UnsizedStream(b"0123456789"))
+
+    assert client.base_client.call_api.call_count == 1
+    call_kwargs = client.base_client.call_api.call_args[1]
+    assert isinstance(call_kwargs["body"], _ChunkedBody)
+    assert call_kwargs["header_params"]["Transfer-Encoding"] == "chunked"
+    assert "Content-Length" not in call_kwargs["header_params"]
+    assert call_kwargs["resource_path"].startswith("/p/par-hash/")
+
+
+def test_put_object_resends_buffered_body_when_chunked_rejected(client):
+    calls = reject_chunked_after_one_chunk(client)
+
+    result = client.put_object(NAMESPACE, BUCKET, "obj", UnsizedStream(b"0123456789"))
+
+    assert result.headers["etag"] == "etag"
+    assert len(calls) == 2
+    assert calls[1]["body"] == b"0123456789"
+    assert calls[1]["header_params"]["Content-Length"] == "10"
+    assert "Transfer-Encoding" not in calls[1]["header_params"]
+
+
+def test_put_object_raises_other_errors_of_chunked_body(client):
+    client.base_client.call_api.side_effect = rejected(status=500)
+
+    with pytest.raises(ServiceError):
+        client.put_object(NAMESPACE, BUCKET, "obj", UnsizedStream(b"0123456789"))
+    assert client.base_client.call_api.call_count == 1
+
+
+def test_upload_part_streams_unsized_body_chunked(client):
+    client.upload_part(
+        NAMESPACE, BUCKET, "obj", "upload-id", 1, UnsizedStream(b"0123456789")
+    )
+
+    assert client.base_client.call_api.call_count == 1
+    call_kwargs = client.base_client.call_api.call_args[1]
+    assert isinstance(call_kwargs["body"], _ChunkedBody)
+    assert call_kwargs["header_params"]["Transfer-Encoding"] == "chunked"
+    assert "Content-Length" not in call_kwargs["header_params"]
+
+
+def test_upload_part_resends_buffered_body_when_chunked_rejected(client):
+    calls = reject_chunked_after_one_chunk(client)
+
+    result = client.upload_part(
+        NAMESPACE, BUCKET, "obj", "upload-id", 1, UnsizedStream(b"0123456789")
+    )
+
+    assert result.headers["etag"] == "etag"
+    assert len(calls) == 2
+    assert calls[1]["body"] == b"0123456789"
+    assert calls[1]["header_params"]["Content-Length"] == "10"
+    assert "Transfer-Encoding" not in calls[1]["header_params"]
+    assert calls[1]["query_params"] == {"uploadId": "upload-id", "uploadPartNum": 1}
+
+
+def test_chunked_body_fallback_is_bounded_by_buffer_limit():
+    body = _ChunkedBody(UnsizedStream(b"0123456789"), 4, buffer_limit=6)
+    assert b"".join(body) == b"0123456789"
+    with pytest.raises(BufferError):
+        body.buffered()
+
+
+class Sized(object):
+    def __len__(self):
+        return 7
+
+    def read(self, size=-1):
+        return b""
+
+
+def test_fast_content_length_of_bytes():
+    assert _fast_content_length(b"0123456789") == 10
+
+
+def test_fast_content_length_of_bytearray():
+    assert _fast_content_length(bytearray(10)) == 10
+
+
+def test_fast_content_length_of_memoryview():
+    view = memoryview(array.array("i", range(4)))
+    assert len(view) == 4
+    assert _fast_content_length(view) == view.nbytes
+
+
+def test_fast_content_length_of_file(tmp_path):
+    path = tmp_path / "body"
+    path.write_bytes(b"0123456789")
+    with open(path, "rb") as f:
+        f.read(3)
+        assert _fast_content_length(f) == 7
+
+
+def test_fast_content_length_of_sized_object():
+    assert _fast_content_length(Sized()) == 7
+
+
+def test_fast_content_length_of_seekable_stream():
+    stream = io.BytesIO(b"0123456789")
+    stream.seek(4)
+    assert _fast_content_length(stream) == 6
+    assert stream.tell() == 4
+
+
+def test_fast_content_length_of_unsized_stream():
+    assert _fast_content_length(UnsizedStream(b"0123456789")) is None
+
+
+@pytest.mark.parametrize(
+    "body",
+    [bytearray(b"0123456789"), memoryview(b"0123456789"), memoryview(bytes(12))[2:]],
+    ids=["bytearray", "memoryview", "memoryview-slice"],
+)
+def test_put_object_accepts_bytes_like_body(client, body):
+    client.put_object(NAMESPACE, BUCKET, "obj", body)
+
+    call_kwargs = client.base_client.call_api.call_args[1]
+    assert call_kwargs["header_params"]["Content-Length"] == "10"
+    assert bytes(call_kwargs["body"]) == bytes(body)
+
+
+def test_upload_part_sends_memoryview_as_byte_view(client):
+    body = memoryview(array.array("i", range(4)))
+
+    client.upload_part(NAMESPACE, BUCKET, "obj", "upload-id", 1, body)
+
+    call_kwargs = client.base_client.call_api.call_args[1]
+    assert call_kwargs["header_params"]["Content-Length"] == str(body.nbytes)
+    assert len(call_kwargs["body"]) == body.nbytes
+
+
+def test_put_object_rejects_unreadable_body(client):
+    with pytest.raises(TypeError):
+        client.put_object(NAMESPACE, BUCKET, "obj", 42)
+
+
+def test_default_retry_strategy_follows_client_retry_strategy(client):
+    def preferred(operation_retry_strategy, client_retry_strategy):
+        return client_retry_strategy or retry.NoneRetryStrategy()
+
+    client.base_client.get_preferred_retry_strategy.side_effect = preferred
+    first = client._get_retry_strategy(None)
+    assert client._get_retry_strategy(None) is first
+
+    client.retry_strategy = retry.NoneRetryStrategy()
+    assert client._get_retry_strategy(None) is client.retry_strategy
+
+
+def part_etags(**call_kwargs):
+    part_num = call_kwargs.get("query_params", {}).get("uploadPartNum")
+    return response(etag=f"etag-{part_num}")
+
+
+def calls_of(client, operation_name):
+    return [
+        call[1]
+        for call in client.base_client.call_api.call_args_list
+        if call[1]["operation_name"] == operation_name
+    ]
+
+
+def test_multipart_session_commits_parts_in_order(client):
+    client.base_client.call_api.side_effect = part_etags
+    session = LakeMultipartSession(
+        client, NAMESPACE, BUCKET, "obj", "upload-id", max_workers=2
+    )
+
+    for part_num in (3, 1, 2):
+        session.submit_part(part_num, bytes(part_num))
+    session.commit()
+
+    (commit,) = calls_of(client, "commit_multipart_upload")
+    committed = [(p.part_num, p.etag) for p in commit["body"].parts_to_commit]
+    assert committed == [(1, "etag-1"), (2, "etag-2"), (3, "etag-3")]
+    assert sorted(
+        call["resource_path"] for call in calls_of(client, "upload_part")
+    ) == [f"/p/par-hash/n/ns/b/bucket/u/obj/id/upload-id/{n}" for n in (1, 2, 3)]
+    assert "upload-id" not in client._par_cache
+
+
+def test_multipart_session_raises_part_failure_instead_of_committing(client):
+    def fail_part_two(**call_kwargs):
+        if call_kwargs["query_params"].get("uploadPartNum") == 2:
+            raise rejected(status=500)
+        return part_etags(**call_kwargs)
+
+    client.base_client.call_api.side_effect = fail_part_two
+    session = LakeMultipartSession(client, NAMESPACE, BUCKET, "obj", "upload-id")
+
+    for part_num in (1, 2, 3):
+        session.submit_part(part_num, bytes(part_num))
+    with pytest.raises(ServiceError):
+        session.commit()
+
+    assert calls_of(client, "commit_multipart_upload") == []
+    assert "upload-id" not in client._par_cache
+
+
+def test_multipart_session_abort(client):
+    client.base_client.call_api.side_effect = part_etags
+    session = LakeMultipartSession(client, NAMESPACE, BUCKET, "obj", "upload-id")
+
+    session.submit_part(1, b"0")
+    session.abort()
+
+    assert len(calls_of(client, "abort_multipart_upload")) == 1
+    assert calls_of(client, "commit_multipart_upload") == []
+    assert "upload-id" not in client._par_cache
+
+
+def test_multipart_session_aborts_when_left_without_commit(client):
+    client.base_client.call_api.side_effect = part_etags
+
+    with pytest.raises(RuntimeError):
+        with LakeMultipartSession(
+            client, NAMESPACE, BUCKET, "obj", "upload-id"
+        ) as session:
+            session.submit_part(1, b"0")
+            raise RuntimeError("interrupted")
+
+    assert len(calls_of(client, "abort_multipart_upload")) == 1
+    assert "upload-id" not in client._par_cache
+
+
+def test_multipart_session_does_not_abort_after_commit(client):
+    client.base_client.call_api.side_effect = part_etags
+
+    with LakeMultipartSession(client, NAMESPACE, BUCKET, "obj", "upload-id") as session:
+        session.submit_part(1, b"0")
+        session.commit()
+
+    assert len(calls_of(client, "commit_multipart_upload")) == 1
+    assert calls_of(client, "abort_multipart_upload") == []
+
+
+def test_multipart_session_requires_lakehouse_managed_bucket(client):
+    with pytest.raises(ValueError):
+        LakeMultipartSession(client, NAMESPACE, "other", "obj", "upload-id")
+
+
+@pytest.fixture
+def lake_client():
+    lake_client = mock.Mock()
+    lake_client.get_lakeshare_endpoint.return_value = "https://lakeshare.example"
+    lake_client.get_lakehouse_mount.return_value = mock.Mock(
+        status=200,
+        data=mock.Mock(mount_spec=mock.Mock(namespace=NAMESPACE, bucket_name=BUCKET)),
+    )
+    return lake_client
+
+
+def test_unhealthy_lake_sharing_client_is_not_cached(client, lake_client):
+    client.lake_ocid_to_lake_sharing_client_map.clear()
+    client.lake_ocid_to_lake_client_map[LAKE_OCID] = lake_client
+
+    with mock.patch(f"{LAKE_MODULE}.LakeSharingClient") as lake_sharing_client_class:
+        lake_sharing_client = lake_sharing_client_class.return_value
+        lake_sharing_client.is_healthy.return_value = False
+        client.get_bucket_namespace_for_given_mount_name(
+            LAKE_OCID, ["mount"], "EXTERNAL"
+        )
+
+        assert LAKE_OCID not in client.lake_ocid_to_lake_sharing_client_map
+        lake_client.invalidate_lakeshare_endpoint.assert_called_once_with(LAKE_OCID)
+
+        lake_sharing_client.is_healthy.return_value = True
+        assert (
+            client.get_lake_sharing_client_by_bucket_namespace(NAMESPACE, BUCKET)
+            is lake_sharing_client
+        )
+
+    assert client.lake_ocid_to_lake_sharing_client_map[LAKE_OCID] is (
+        lake_sharing_client
+    )
+    assert lake_client.get_lakeshare_endpoint.call_count == 2
+
+
+def par_hashes(*hashes):
+    return [mock.Mock(data=mock.Mock(par_hash=par_hash)) for par_hash in hashes]
+
+
+def test_open_write_session_generates_one_prefix_par(client, lake_sharing_client):
+    session = client.open_write_session(NAMESPACE, BUCKET, "dir/")
+
+    lake_sharing_client.generate_par.assert_called_once_with(
+        NAMESPACE, BUCKET, "WRITE", None, prefix="dir/"
+    )
+    assert session.par_hash == "par-hash"
+    assert not session.expires_soon()
+
+    client.put_object(NAMESPACE, BUCKET, "dir/a", b"a", write_session=session)
+    client.upload_part(
+        NAMESPACE, BUCKET, "dir/b", "upload-id", 1, b"b", write_session=session
+    )
+
+    assert lake_sharing_client.generate_par.call_count == 1
+    assert [
+        call[1]["resource_path"].split("/n/")[0]
+        for call in client.base_client.call_api.call_args_list
+    ] == ["/p/par-hash", "/p/par-hash"]
+    assert "upload-id" not in client._par_cache
+
+
+def test_write_session_is_renewed_before_it_expires(client, lake_sharing_client):
+    lake_sharing_client.generate_par.side_effect = par_hashes("first", "second")
+    session = client.open_write_session(NAMESPACE, BUCKET, "dir/")
+    session.expiry = time.monotonic() + 1
+
+    client.put_object(NAMESPACE, BUCKET, "dir/a", b"a", write_session=session)
+
+    assert lake_sharing_client.generate_par.call_count == 2
+    assert lake_sharing_client.generate_par.call_args == mock.call(
+        NAMESPACE, BUCKET, "WRITE", None, prefix="dir/"
+    )
+    assert session.par_hash == "second"
+    assert not session.expires_soon()
+    resource_path = client.base_client.call_api.call_args[1]["resource_path"]
+    assert resource_path.startswith("/p/second/")
+
+
+@pytest.mark.parametrize(
+    "bucket, object_name",
+    [(BUCKET, "other/a"), (BUCKET, "dir"), ("other", "dir/a")],
+    ids=["other-prefix", "prefix-without-slash", "other-bucket"],
+)
+def test_write_session_rejects_objects_outside_it(client, bucket, object_name):
+    session = client.open_write_session(NAMESPACE, BUCKET, "dir/")
+
+    with pytest.raises(ValueError):
+        client.put_object(NAMESPACE, bucket, object_name, b"a", write_session=session)
+    with pytest.raises(ValueError):
+        client.upload_part(
+            NAMESPACE, bucket, object_name, "upload-id", 1, b"a", write_session=session
+        )
+    client.base_client.call_api.assert_not_called()
+
+
+def test_open_write_session_requires_lakehouse_managed_bucket(client):
+    with pytest.raises(ValueError):
+        client.open_write_session(NAMESPACE, "other", "dir/")
@@ -3,10 +3,12 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 import io
+from functools import lru_cache
 import fsspec
 import pytest
 import oci
 import os
+from concurrent.futures import ThreadPoolExecutor
 from ocifs import OCIFileSystem
 from ocifs.errors import translate_oci_error
 from oci._vendor.requests.structures import CaseInsensitiveDict
@@ -17,7 +19,15 @@ from ocifs.data_lake.lake_sharing_object_storage_client import (
 
 
 profile_name = os.environ["OCIFS_CONFIG_PROFILE"]
-config = oci.config.from_file("~/.oci/config", profile_name=profile_name)
+
+
+@lru_cache(maxsize=None)
+def _load_oci_config(file_location="~/.oci/config", profile_name="DEFAULT"):
+    """Parse an OCI config file once per (location, profile)."""
+    return oci.config.from_file(file_location, profile_name)
+
+
+config = _load_oci_config(profile_name=profile_name)
 full_external_mount_name = os.environ["OCIFS_EXTERNAL_MOUNT_URI"]
 storage_options = {"config": config}
 test_bucket_with_namespace = ""
@@ -53,34 +63,98 @@ text_files = {
     "nested/nested2/file2": b"world",
 }
 glob_files = {"file.dat": b"", "filexdat": b""}
+seed_objects = {
+    os.path.join(full_external_mount_name, f): data
+    for flist in [files, csv_files, text_files, glob_files]
+    for f, data in flist.items()
+}
+SEED_MAX_WORKERS = 16
 a_path = "tmp/test/a"
 b_path = "tmp/test/b"
 c_path = "tmp/test/c"
 a = os.path.join(full_external_mount_name, a_path)
 b = os.path.join(full_external_mount_name, b_path)
 c = os.path.join(full_external_mount_name, c_path)
+# Every path a test may create, deleted again after each test.
+mutable_paths = (
+    a,
+    b,
+    c,
+    *(
+        f"{full_external_mount_name}/{name}"
+        for name in (
+            "temp",
+            "myfile",
+            "file.txt",
+            "auto_file",
+            "commit_file",
+            "auto_commit_with_mpu",
+        )
+    ),
+)
+# Removed by test_bulk_delete; when it is missing the seed set is restored.
+seed_spot_check = os.path.join(full_external_mount_name, "nested/file1")
+
+
+def _seed(fs):
+    # fs.pipe(seed_objects) would write the files one after another, so fan
+    # the per-file writes out instead and let their round trips overlap.
+    with ThreadPoolExecutor(max_workers=SEED_MAX_WORKERS) as executor:
+        list(executor.map(fs.pipe_file, seed_objects, seed_objects.values()))
+    fs.invalidate_cache()
+
+
+@lru_cache(maxsize=1)
+def _bucket_ns_prefix(fs):
+    """``bucket@namespace/`` behind the mount, resolved once per filesystem.
+
+    Splitting a mount URI asks the lake service for the bucket and namespace,
+    so the tests share a single lookup instead of making their own.
+    """
+    bucket, namespace, _ = fs.split_path(full_external_mount_name + "/test")
+    return f"{bucket}@{namespace}/"
 
 
-@pytest.fixture
+def _parallel(calls):
+    """Run independent ``(fn, args)`` calls concurrently; results keep their order."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(fn, *args) for fn, args in calls]
+        return [future.result() for future in futures]
+
+
+@pytest.fixture(scope="module")
 def fs():
     OCIFileSystem.clear_instance_cache()
-    fs = OCIFileSystem(
-        config="~/.oci/config", profile=profile_name
-    )  # Using env var to set IAM type
+    # Using env var to set IAM type
+    fs = OCIFileSystem(config=config, profile=profile_name)
     try:
         client = LakeSharingObjectStorageClient(config)
     except ServiceError as e:
         raise translate_oci_error(e) from e
-    for flist in [files, csv_files, text_files, glob_files]:
-        for f, values in flist.items():
-            file_path = os.path.join(full_external_mount_name, f)
-            fs.touch(file_path, truncate=True, data=values)
-    fs.invalidate_cache()
+    _seed(fs)
     yield fs
 
 
-def test_simple(fs):
-    data = b"a" * (10 * 2**20)
+@pytest.fixture(autouse=True)
+def _cleanup(fs):
+    """Delete what the test wrote and restore the seed set if it was removed."""
+    yield
+
+    def remove(path):
+        try:
+            fs.rm(path)
+        except FileNotFoundError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=SEED_MAX_WORKERS) as executor:
+        list(executor.map(remove, mutable_paths))
+    fs.invalidate_cache()
+    if not fs.exists(seed_spot_check):
+        _seed(fs)
+
+
+def test_simple(fs, payload):
+    data = payload(b"a", 10 * 2**20)
 
     with fs.open(a, "wb") as f:
         f.write(data)
@@ -92,8 +166,8 @@ def test_simple(fs):
 
 
 @pytest.mark.parametrize("default_cache_type", ["none", "bytes"])
-def test_default_cache_type(default_cache_type):
-    data = b"a" * (10 * 2**20)
+def test_default_cache_type(default_cache_type, payload):
+    data = payload(b"a", 10 * 2**20)
     oci_fs = OCIFileSystem(config=config, default_cache_type=default_cache_type)
 
     with oci_fs.open(a, "wb") as f:
@@ -135,16 +209,12 @@ def test_multiple_objects(fs):
 
 
 def test_ls(fs):
-    bucket, namespace, key = fs.split_path(full_external_mount_name + "/test")
-    test_bucket_with_namespace = bucket + "@" + namespace + "/"
-    fn = test_bucket_with_namespace + "test/accounts.1.json"
+    fn = _bucket_ns_prefix(fs) + "test/accounts.1.json"
     assert fn in fs.ls(full_external_mount_name + "/test")
 
 
 def test_ls_touch(fs):
-    bucket, namespace, key = fs.split_path(full_external_mount_name + "/test")
-    test_bucket_with_namespace = bucket + "@" + namespace + "/"
-    test_dir_path = test_bucket_with_namespace + "tmp/test/"
+    test_dir_path = _bucket_ns_prefix(fs) + "tmp/test/"
     fs.touch(a)
     fs.touch(b)
     L = fs.ls(full_external_mount_name + "/tmp/test", detail=True)
@@ -152,31 +222,45 @@ def test_ls_touch(fs):
 
 
 def test_isfile(fs):
-    assert not fs.isfile(full_external_mount_name)
-    assert not fs.isfile(full_external_mount_name + "/test")
-    assert fs.isfile(full_external_mount_name + "/test/accounts.1.json")
-    assert fs.isfile(full_external_mount_name + "/test/accounts.2.json")
+    paths = [
+        full_external_mount_name,
+        full_external_mount_name + "/test",
+        full_external_mount_name + "/test/accounts.1.json",
+        full_external_mount_name + "/test/accounts.2.json",
+    ]
+    results = _parallel([(fs.isfile, (p,)) for p in paths])
+    assert results == [False, False, True, True]
 
 
 def test_isdir(fs):
-    assert fs.isdir(full_external_mount_name)
-    assert fs.isdir(full_external_mount_name + "/test")
-    assert not fs.isdir(full_external_mount_name + "/test/accounts.1.json")
-    assert not fs.isdir(full_external_mount_name + "/test/accounts.2.json")
-    assert not fs.isdir(b + "/")
-    assert not fs.isdir(c)
+    paths = [
+        full_external_mount_name,
+        full_external_mount_name + "/test",
+        full_external_mount_name + "/test/accounts.1.json",
+        full_external_mount_name + "/test/accounts.2.json",
+        b + "/",
+        c,
+    ]
+    results = _parallel([(fs.isdir, (p,)) for p in paths])
+    assert results == [True, True, False, False, False, False]
 
 
 def test_oci_file_info(fs):
-    bucket, namespace, key = fs.split_path(full_external_mount_name + "/test")
-    test_bucket_with_namespace = bucket + "@" + namespace + "/"
-    nested_file1_path = test_bucket_with_namespace + "nested/file1"
+    nested_file1_path = _bucket_ns_prefix(fs) + "nested/file1"
     fn = full_external_mount_name + "/nested/file1"
     data = b"hello\n"
-    assert nested_file1_path in fs.find(full_external_mount_name)
-    assert fs.exists(fn)
-    assert not fs.exists(fn + "another")
-    assert fs.info(fn)["size"] == len(data)
+    found, exists, exists_another, info = _parallel(
+        [
+            (fs.find, (full_external_mount_name,)),
+            (fs.exists, (fn,)),
+            (fs.exists, (fn + "another",)),
+            (fs.info, (fn,)),
+        ]
+    )
+    assert nested_file1_path in found
+    assert exists
+    assert not exists_another
+    assert info["size"] == len(data)
     with pytest.raises(FileNotFoundError):
         fs.info(fn + "another")
 
@@ -184,9 +268,7 @@ def test_oci_file_info(fs):
 def test_du(fs):
     d = fs.du(full_external_mount_name, total=False)
     assert all(isinstance(v, int) and v >= 0 for v in d.values())
-    bucket, namespace, key = fs.split_path(full_external_mount_name + "/test")
-    test_bucket_with_namespace = bucket + "@" + namespace + "/"
-    nested_file1_path = test_bucket_with_namespace + "nested/file1"
+    nested_file1_path = _bucket_ns_prefix(fs) + "nested/file1"
     assert nested_file1_path in d
     assert fs.du(full_external_mount_name + "/test/", total=True) == sum(
         map(len, files.values())
@@ -194,12 +276,17 @@ def test_du(fs):
 
 
 def test_oci_ls(fs):
-    bucket, namespace, key = fs.split_path(full_external_mount_name + "/test")
-    test_bucket_with_namespace = bucket + "@" + namespace + "/"
-    nested_file1_path = test_bucket_with_namespace + "nested/file1"
-    assert nested_file1_path not in fs.ls(full_external_mount_name + "/")
-    assert nested_file1_path in fs.ls(full_external_mount_name + "/nested/")
-    assert nested_file1_path in fs.ls(full_external_mount_name + "/nested")
+    nested_file1_path = _bucket_ns_prefix(fs) + "nested/file1"
+    root, nested_slash, nested = _parallel(
+        [
+            (fs.ls, (full_external_mount_name + "/",)),
+            (fs.ls, (full_external_mount_name + "/nested/",)),
+            (fs.ls, (full_external_mount_name + "/nested",)),
+        ]
+    )
+    assert nested_file1_path not in root
+    assert nested_file1_path in nested_slash
+    assert nested_file1_path in nested
 
 
 def test_oci_ls_detail(fs):
@@ -266,21 +353,22 @@ def test_write_fails(fs):
     assert not fs.exists(full_external_mount_name + "/temp")
 
 
-def test_write_blocks(fs):
+def test_write_blocks(fs, payload):
+    two_mb = payload(b"a", 2 * 2**20)
     with fs.open(full_external_mount_name + "/temp", "wb") as f:
-        f.write(b"a" * 2 * 2**20)
+        f.write(two_mb)
         assert f.buffer.tell() == 2 * 2**20
         assert not (f.parts)
         f.flush()
         assert f.buffer.tell() == 2 * 2**20
         assert not (f.parts)
-        f.write(b"a" * 2 * 2**20)
-        f.write(b"a" * 2 * 2**20)
+        f.write(two_mb)
+        f.write(two_mb)
         assert f.mpu
         assert f.parts
     assert fs.info(full_external_mount_name + "/temp")["size"] == 6 * 2**20
     with fs.open(full_external_mount_name + "/temp", "wb", block_size=10 * 2**20) as f:
-        f.write(b"a" * 15 * 2**20)
+        f.write(payload(b"a", 15 * 2**20))
         assert f.buffer.tell() == 0
     assert fs.info(full_external_mount_name + "/temp")["size"] == 15 * 2**20
     fs.rm(full_external_mount_name + "/temp", recursive=True)
@@ -296,18 +384,20 @@ def test_readline_empty(fs):
         assert result == data
 
 
-def test_readline_blocksize(fs):
-    data = b"ab\n" + b"a" * (10 * 2**20) + b"\nab"
+def test_readline_blocksize(fs, payload):
+    long_line = payload(b"a", 10 * 2**20)
     with fs.open(a, "wb") as f:
-        f.write(data)
+        f.write(b"ab\n")
+        f.write(long_line)
+        f.write(b"\nab")
     with fs.open(a, "rb") as f:
         result = f.readline()
         expected = b"ab\n"
         assert result == expected
 
         result = f.readline()
-        expected = b"a" * (10 * 2**20) + b"\n"
-        assert result == expected
+        assert result[:-1] == long_line
+        assert result[-1:] == b"\n"
 
         result = f.readline()
         expected = b"ab"
@@ -366,13 +456,13 @@ def test_writable(fs):
         assert not f.writable()
 
 
-def test_multipart_upload_blocksize(fs):
+def test_multipart_upload_blocksize(fs, payload):
     blocksize = 5 * (2**20)
     expected_parts = 3
 
     fs2 = fs.open(a, "wb", block_size=blocksize)
+    data = payload(b"b", blocksize)
     for _ in range(3):
-        data = b"b" * blocksize
         fs2.write(data)
 
     # Ensure that the multipart upload consists of only 3 parts
@@ -485,10 +575,10 @@ def test_touch(fs):
     assert fs.size(a) == 0
 
 
-def test_seek_reads(fs):
+def test_seek_reads(fs, payload):
     fn = full_external_mount_name + "/myfile"
     with fs.open(fn, "wb") as f:
-        f.write(b"a" * 175627146)
+        f.write(payload(b"a", 175627146))
     with fs.open(fn, "rb", blocksize=100) as f:
         f.seek(175561610)
         d1 = f.read(65536)
@@ -5,11 +5,23 @@
 import sys
 
 
-__version__ = "UNKNOWN"
 # https://packaging.python.org/en/latest/guides/single-sourcing-package-version/#single-sourcing-the-package-version
 if sys.version_info >= (3, 8):
     from importlib import metadata
 else:
     import importlib_metadata as metadata
 
-__version__ = metadata.version("ocifs")
+
+def __getattr__(name):
+    # Looking up the installed version scans sys.path, so only do it the first
+    # time __version__ is read rather than on every import (PEP 562).
+    if name == "__version__":
+        global __version__
+        __version__ = metadata.version("ocifs")
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is not supported before Python 3.7.
+    __version__ = metadata.version("ocifs")